@@ -21,6 +21,7 @@ from fastapi_orm.relations import (
     ManyToOne,
     ManyToMany,
     create_association_table,
+    bulk_associate,
 )
 from fastapi_orm.migrations import MigrationManager
 from fastapi_orm.mixins import SoftDeleteMixin, TimestampMixin
@@ -29,6 +30,7 @@ from fastapi_orm.exceptions import (
     RecordNotFoundError,
     DuplicateRecordError,
     ValidationError,
+    ConcurrentModificationError,
     DatabaseError,
     TransactionError,
 )
@@ -151,6 +153,7 @@ from fastapi_orm.validators import (
     PasswordStrengthValidator,
     UniqueValidator,
     ConditionalValidator,
+    CompositeValidator,
     min_length,
     max_length,
     length_range,
@@ -305,6 +308,7 @@ __all__ = [
     "ManyToOne",
     "ManyToMany",
     "create_association_table",
+    "bulk_associate",
     "MigrationManager",
     "SoftDeleteMixin",
     "TimestampMixin",
@@ -312,6 +316,7 @@ __all__ = [
     "RecordNotFoundError",
     "DuplicateRecordError",
     "ValidationError",
+    "ConcurrentModificationError",
     "DatabaseError",
     "TransactionError",
     "transactional",
@@ -438,6 +443,7 @@ __all__ = [
     "PasswordStrengthValidator",
     "UniqueValidator",
     "ConditionalValidator",
+    "CompositeValidator",
     "min_length",
     "max_length",
     "length_range",
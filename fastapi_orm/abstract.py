@@ -0,0 +1,66 @@
+from typing import Type, Dict, Any, Optional
+from fastapi_orm.model import Model
+from fastapi_orm.fields import Field
+
+
+class AbstractModel(Model):
+    """
+    Base class for abstract models.
+
+    Abstract models let you define shared fields and methods once and
+    reuse them across multiple concrete models. They are never mapped to
+    a database table themselves - only concrete subclasses (those that
+    declare a __tablename__) are.
+
+    Example:
+        class TimestampedModel(AbstractModel):
+            __abstract__ = True
+
+            created_at = DateTimeField(auto_now_add=True)
+            updated_at = DateTimeField(auto_now=True)
+
+        class Article(TimestampedModel):
+            __tablename__ = "articles"
+
+            id: int = IntegerField(primary_key=True)
+            title: str = StringField(max_length=200)
+            # Inherits created_at and updated_at
+    """
+    __abstract__ = True
+    __allow_unmapped__ = True
+
+
+def create_abstract_model(
+    name: str,
+    fields: Dict[str, Field],
+    methods: Optional[Dict[str, Any]] = None,
+) -> Type[AbstractModel]:
+    """
+    Dynamically create an abstract model class.
+
+    Useful when shared base classes need to be built programmatically,
+    e.g. from configuration.
+
+    Args:
+        name: Name of the abstract model class
+        fields: Mapping of attribute name to Field instance
+        methods: Optional mapping of attribute name to method/classmethod
+
+    Returns:
+        A new abstract model class that can be subclassed by concrete models
+
+    Example:
+        Auditable = create_abstract_model("Auditable", {
+            "created_by": StringField(max_length=100, nullable=True),
+            "updated_by": StringField(max_length=100, nullable=True),
+        })
+
+        class Document(Auditable):
+            __tablename__ = "documents"
+            id: int = IntegerField(primary_key=True)
+    """
+    namespace: Dict[str, Any] = {"__abstract__": True, "__allow_unmapped__": True}
+    namespace.update(fields)
+    if methods:
+        namespace.update(methods)
+    return type(name, (AbstractModel,), namespace)
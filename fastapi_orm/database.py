@@ -49,6 +49,8 @@ class Database:
         log_slow_queries: bool = False,
         slow_query_threshold: float = 1.0,
         base: Optional[Any] = None,
+        poolclass: Optional[Any] = None,
+        connect_args: Optional[Dict[str, Any]] = None,
     ):
         """
         Initialize database connection.
@@ -64,9 +66,15 @@ class Database:
             log_slow_queries: Log queries that exceed slow_query_threshold (default: False)
             slow_query_threshold: Threshold in seconds for slow query warnings (default: 1.0)
             base: Optional custom declarative base for testing or multi-tenancy (default: uses global Base)
-        
+            poolclass: Optional SQLAlchemy pool class (e.g. StaticPool to share
+                one hot connection across sessions)
+            connect_args: Optional driver connection arguments (e.g.
+                {"check_same_thread": False} for SQLite)
+
         Note:
-            Pool settings are ignored for SQLite as it uses a different pool implementation.
+            Pool settings are ignored for SQLite as it uses a different pool
+            implementation; in-memory SQLite already defaults to StaticPool,
+            so every session reuses the same connection.
         """
         self.database_url = database_url
         self.echo = echo
@@ -95,7 +103,12 @@ class Database:
                 "pool_recycle": pool_recycle,
                 "pool_pre_ping": pool_pre_ping,
             })
-        
+
+        if poolclass is not None:
+            engine_kwargs["poolclass"] = poolclass
+        if connect_args is not None:
+            engine_kwargs["connect_args"] = connect_args
+
         self.engine = create_async_engine(database_url, **engine_kwargs)
         
         # Setup query logging if enabled
@@ -32,6 +32,11 @@ class ValidationError(FastAPIOrmException):
         super().__init__(f"Validation error for {field}: {message}", details={"field": field})
 
 
+class ConcurrentModificationError(ValidationError):
+    """Raised when an optimistic-lock update finds a stale version"""
+    pass
+
+
 class DatabaseError(FastAPIOrmException):
     """Raised when a database operation fails"""
     def __init__(self, operation: str, original_error: Optional[Exception] = None):
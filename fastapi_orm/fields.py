@@ -149,6 +149,7 @@ def StringField(
     unique: bool = False,
     index: bool = False,
     default: Optional[str] = None,
+    server_default: Any = None,
     validators: Optional[List[Callable[[Any], bool]]] = None,
     min_length: Optional[int] = None,
 ) -> Field:
@@ -158,6 +159,7 @@ def StringField(
         unique=unique,
         index=index,
         default=default,
+        server_default=server_default,
         validators=validators,
         min_length=min_length,
         max_length=max_length,
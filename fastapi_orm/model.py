@@ -1,5 +1,5 @@
 from typing import Type, TypeVar, List, Optional, Any, Dict
-from sqlalchemy import select, update as sql_update, delete as sql_delete
+from sqlalchemy import select, update as sql_update, delete as sql_delete, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeMeta
 from pydantic import BaseModel, create_model
@@ -116,9 +116,10 @@ class Model(Base, metaclass=ModelMeta):
         Returns:
             Model instance or None if not found
         """
-        result = await session.execute(
-            select(cls).where(cls.id == id)
-        )
+        # lambda_stmt caches the constructed/compiled statement per model
+        # class; only the id value changes between calls
+        stmt = lambda_stmt(lambda: select(cls).where(cls.id == id))
+        result = await session.execute(stmt)
         return result.scalar_one_or_none()
     
     @classmethod
@@ -276,8 +277,33 @@ class Model(Base, metaclass=ModelMeta):
         for key, value in filters.items():
             query = query.where(getattr(cls, key) == value)
         result = await session.execute(query)
-        return result.scalar()
+        return result.scalar_one()
     
+    @classmethod
+    async def pluck(cls, session: AsyncSession, *columns: str, **filters) -> List[Any]:
+        """
+        Fetch only the given columns as plain values, skipping ORM
+        instance construction entirely.
+
+        Args:
+            session: AsyncSession instance
+            *columns: Column names to select
+            **filters: Field name and value pairs
+
+        Returns:
+            List of values (single column) or list of tuples (multiple columns)
+
+        Example:
+            titles = await Book.pluck(session, "title", author_id=author.id)
+        """
+        query = select(*(getattr(cls, c) for c in columns))
+        for key, value in filters.items():
+            query = query.where(getattr(cls, key) == value)
+        result = await session.execute(query)
+        if len(columns) == 1:
+            return list(result.scalars().all())
+        return [tuple(row) for row in result.all()]
+
     @classmethod
     async def exists(cls, session: AsyncSession, **filters) -> bool:
         """
@@ -105,16 +105,20 @@ def ManyToOne(related_model: str, back_populates: Optional[str] = None):
 def ManyToMany(
     related_model: str,
     secondary: "Table",
-    back_populates: Optional[str] = None
+    back_populates: Optional[str] = None,
+    lazy: str = "selectin"
 ):
     """
     Defines a many-to-many relationship.
-    
+
     Args:
         related_model: Name of the related model class
         secondary: Association table for the many-to-many relationship
         back_populates: Name of the reverse relationship attribute
-    
+        lazy: Loading strategy (default "selectin", which batch-fetches the
+            whole collection with a single WHERE IN query instead of one
+            SELECT per row)
+
     Returns:
         SQLAlchemy relationship
     """
@@ -122,7 +126,7 @@ def ManyToMany(
         related_model,
         secondary=secondary,
         back_populates=back_populates,
-        lazy="selectin",
+        lazy=lazy,
     )
 
 
@@ -145,7 +149,14 @@ def create_association_table(
         SQLAlchemy Table
     """
     from sqlalchemy import Table, Column, Integer, ForeignKey
-    
+
+    # Repeated calls (e.g. at test-module import) reuse the Table already
+    # registered on this base instead of rebuilding Column objects and
+    # tripping duplicate-registration warnings.
+    existing = base.metadata.tables.get(table_name)
+    if existing is not None:
+        return existing
+
     return Table(
         table_name,
         base.metadata,
@@ -162,3 +173,70 @@ def create_association_table(
             primary_key=True
         )
     )
+
+
+async def bulk_associate(
+    session: Any,
+    parent: Any,
+    relationship_name: str,
+    children: List[Any]
+) -> int:
+    """
+    Link a parent to many children through a many-to-many relationship
+    with a single executemany INSERT on the association table.
+
+    Appending children to the relationship collection one at a time emits
+    one INSERT per association row on flush; this helper issues them all
+    in one statement.
+
+    Args:
+        session: AsyncSession instance
+        parent: Parent model instance
+        relationship_name: Name of the many-to-many relationship attribute
+        children: Child model instances to associate
+
+    Returns:
+        Number of association rows inserted
+
+    Example:
+        await bulk_associate(session, book, "tags", tags)
+    """
+    from sqlalchemy import inspect as sa_inspect
+
+    if not children:
+        return 0
+
+    mapper = sa_inspect(type(parent)).mapper
+    prop = mapper.relationships[relationship_name]
+    secondary = prop.secondary
+    if secondary is None:
+        raise ValueError(
+            f"Relationship '{relationship_name}' is not a many-to-many relationship"
+        )
+
+    parent_table = mapper.local_table
+    parent_col = None
+    child_col = None
+    for column in secondary.columns:
+        for fk in column.foreign_keys:
+            if fk.column.table is parent_table:
+                parent_col = column
+            else:
+                child_col = column
+
+    if parent_col is None or child_col is None:
+        # Both association columns point at the parent table for
+        # self-referential many-to-many relationships, so the sides
+        # cannot be told apart by foreign-key target
+        raise ValueError(
+            f"Could not determine parent and child columns on association "
+            f"table '{secondary.name}' for relationship '{relationship_name}'; "
+            f"self-referential many-to-many relationships are not supported"
+        )
+
+    rows = [
+        {parent_col.name: parent.id, child_col.name: child.id}
+        for child in children
+    ]
+    await session.execute(secondary.insert(), rows)
+    return len(rows)
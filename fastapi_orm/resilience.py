@@ -73,21 +73,25 @@ class CircuitBreaker:
         failure_threshold: int = 5,
         recovery_timeout: Optional[float] = None,
         timeout: Optional[float] = None,
-        half_open_attempts: int = 1
+        half_open_attempts: int = 1,
+        time_func: Callable[[], datetime] = datetime.utcnow
     ):
         """
         Initialize circuit breaker.
-        
+
         Args:
             failure_threshold: Number of failures before opening circuit
             recovery_timeout: Seconds to wait before attempting recovery (deprecated, use timeout)
             timeout: Seconds to wait before attempting recovery
             half_open_attempts: Number of successful attempts to close circuit
+            time_func: Clock used for recovery timing; tests can inject a
+                fake clock instead of sleeping through the timeout
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = timeout or recovery_timeout or 60.0
         self.timeout = self.recovery_timeout  # Alias for compatibility
         self.half_open_attempts = half_open_attempts
+        self.time_func = time_func
         
         self.failure_count = 0
         self.success_count = 0
@@ -120,7 +124,7 @@ class CircuitBreaker:
     def record_failure(self) -> None:
         """Record a failed operation."""
         self.failure_count += 1
-        self.last_failure_time = datetime.utcnow()
+        self.last_failure_time = self.time_func()
         
         if self.failure_count >= self.failure_threshold:
             if self._state != "open":
@@ -136,7 +140,7 @@ class CircuitBreaker:
         
         if self._state == "open":
             if self.last_failure_time:
-                time_since_failure = (datetime.utcnow() - self.last_failure_time).total_seconds()
+                time_since_failure = (self.time_func() - self.last_failure_time).total_seconds()
                 if time_since_failure >= self.recovery_timeout:
                     logger.info("Circuit breaker entering half-open state")
                     self._state = "half-open"
@@ -205,27 +209,29 @@ def get_circuit_breaker() -> CircuitBreaker:
 
 async def exponential_backoff(
     attempt: int,
-    config: RetryConfig
+    config: RetryConfig,
+    sleep: Callable = asyncio.sleep
 ) -> None:
     """
     Calculate and wait for exponential backoff delay.
-    
+
     Args:
         attempt: Current attempt number (0-based)
         config: Retry configuration
+        sleep: Coroutine used to wait; tests can inject a fake sleep
     """
     import random
-    
+
     delay = min(
         config.initial_delay * (config.exponential_base ** attempt),
         config.max_delay
     )
-    
+
     if config.jitter:
         delay = delay * (0.5 + random.random())
-    
+
     logger.debug(f"Waiting {delay:.2f}s before retry attempt {attempt + 1}")
-    await asyncio.sleep(delay)
+    await sleep(delay)
 
 
 def is_transient_error(exception: Exception) -> bool:
@@ -268,16 +274,19 @@ def is_transient_error(exception: Exception) -> bool:
 def with_retry(
     max_attempts: Optional[int] = None,
     config: Optional[RetryConfig] = None,
-    use_circuit_breaker: bool = True
+    use_circuit_breaker: bool = True,
+    sleep: Callable = asyncio.sleep
 ):
     """
     Decorator to add retry logic to async functions.
-    
+
     Args:
         max_attempts: Maximum retry attempts (overrides config)
         config: Retry configuration
         use_circuit_breaker: Whether to use circuit breaker
-    
+        sleep: Coroutine used for backoff waits (default: asyncio.sleep);
+            tests can inject a fake sleep to avoid real delays
+
     Returns:
         Decorated function with retry logic
     
@@ -349,7 +358,7 @@ def with_retry(
                         logger.warning(
                             f"{func.__name__} failed on attempt {attempt + 1}/{total_attempts}: {e}"
                         )
-                        await exponential_backoff(attempt, retry_config)
+                        await exponential_backoff(attempt, retry_config, sleep=sleep)
                     else:
                         logger.error(
                             f"{func.__name__} failed after {total_attempts} attempts: {e}"
@@ -5,6 +5,11 @@ from fastapi_orm.database import Database
 import random
 import string
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class Seeder:
     """
@@ -45,25 +50,54 @@ class Seeder:
         self.database = database
         self._factories: Dict[str, Callable] = {}
     
+    @staticmethod
+    def _generate_column(value: Any, count: int, vectorize: bool) -> List[Any]:
+        """
+        Generate all values for one field up front.
+
+        With ``vectorize`` enabled and NumPy available, arithmetic lambdas
+        like ``lambda i: 18 + i`` are evaluated once over ``np.arange(count)``
+        in C instead of being called per row. The probe call means stateful
+        callables (``next(counter)``, random generators) would be invoked an
+        extra time, which is why vectorization is opt-in.
+        """
+        if not callable(value):
+            return [value] * count
+        if vectorize and np is not None and count > 1:
+            try:
+                result = value(np.arange(count))
+                if isinstance(result, np.ndarray) and len(result) == count:
+                    return result.tolist()
+            except Exception:
+                pass
+        return [value(i) for i in range(count)]
+
     async def seed(
         self,
         model: Type[Model],
         count: int,
         data: Dict[str, Any],
-        session: Optional[AsyncSession] = None
+        session: Optional[AsyncSession] = None,
+        vectorize: bool = False
     ) -> List[Model]:
         """
         Seed database with model instances.
-        
+
         Args:
             model: Model class to create instances of
             count: Number of instances to create
             data: Dictionary with field values (can use callables for dynamic values)
             session: Optional session to use (creates new one if not provided)
-        
+            vectorize: Evaluate arithmetic lambdas over a NumPy range when
+                NumPy is installed (default: False). Only enable when every
+                callable is stateless and array-safe: each one is probed
+                with an ``np.arange(count)`` argument, so a callable that
+                draws from a random generator or counter would be invoked
+                one extra time
+
         Returns:
             List of created model instances
-        
+
         Example:
             users = await seeder.seed(User, 10, {
                 "username": lambda i: f"user{i}",
@@ -72,16 +106,15 @@ class Seeder:
             })
         """
         instances = []
-        
+
+        columns = {
+            key: self._generate_column(value, count, vectorize)
+            for key, value in data.items()
+        }
+
         async def _seed_in_session(sess: AsyncSession):
             for i in range(count):
-                instance_data = {}
-                for key, value in data.items():
-                    if callable(value):
-                        instance_data[key] = value(i)
-                    else:
-                        instance_data[key] = value
-                
+                instance_data = {key: values[i] for key, values in columns.items()}
                 instance = await model.create(sess, **instance_data)
                 instances.append(instance)
             return instances
@@ -152,10 +185,26 @@ class Seeder:
         """
         if name not in self._factories:
             raise ValueError(f"Factory '{name}' not registered")
-        
+
         factory = self._factories[name]
-        data_with_callable = {key: (lambda i, k=key: factory(i)[k]) for key in factory(0).keys()}
-        return await self.seed(model, count, data_with_callable, session)
+
+        # Evaluate the factory once per row; the previous per-key wrapper
+        # lambdas re-invoked the whole factory for every field of every row
+        rows = [factory(i) for i in range(count)]
+
+        instances = []
+
+        async def _seed_in_session(sess: AsyncSession):
+            for row in rows:
+                instance = await model.create(sess, **row)
+                instances.append(instance)
+            return instances
+
+        if session:
+            return await _seed_in_session(session)
+        else:
+            async with self.database.session() as sess:
+                return await _seed_in_session(sess)
     
     async def truncate(
         self,
@@ -172,11 +221,14 @@ class Seeder:
         Returns:
             Number of records deleted
         """
+        from sqlalchemy import delete
+
         async def _truncate_in_session(sess: AsyncSession):
-            instances = await model.all(sess)
-            count = len(instances)
-            for instance in instances:
-                await instance.delete(sess)
+            count = await model.count(sess)
+            # One DELETE statement instead of loading and deleting rows
+            # through the ORM one at a time
+            await sess.execute(delete(model))
+            await sess.flush()
             return count
         
         if session:
@@ -58,23 +58,30 @@ class QueryStreamer:
     async def stream_records(
         self,
         session: AsyncSession,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None
     ) -> AsyncIterator:
         """
         Stream individual records one at a time.
-        
+
         Args:
             session: Database session
             filters: Optional filter criteria
-        
+            columns: Optional list of column names to fetch (default: all)
+
         Yields:
             Individual model instances
         """
         offset = 0
-        
+
         while True:
-            query = select(self.model_class.__table__)
-            
+            if columns:
+                query = select(
+                    *(getattr(self.model_class.__table__.c, c) for c in columns)
+                )
+            else:
+                query = select(self.model_class.__table__)
+
             if filters:
                 for key, value in filters.items():
                     column = getattr(self.model_class.__table__.c, key)
@@ -113,33 +120,23 @@ class QueryStreamer:
         Yields:
             Lists of model instances (batches)
         """
-        offset = 0
-        
-        while True:
-            query = select(self.model_class.__table__)
-            
-            if filters:
-                for key, value in filters.items():
-                    column = getattr(self.model_class.__table__.c, key)
-                    query = query.where(column == value)
-            
-            query = query.order_by(
-                getattr(self.model_class.__table__.c, self.order_by)
-            ).offset(offset).limit(self.batch_size)
-            
-            result = await session.execute(query)
-            rows = result.fetchall()
-            
-            if not rows:
-                break
-            
-            batch = [dict(row._mapping) for row in rows]
-            yield batch
-            
-            offset += self.batch_size
-            
-            if len(rows) < self.batch_size:
-                break
+        query = select(self.model_class.__table__)
+
+        if filters:
+            for key, value in filters.items():
+                column = getattr(self.model_class.__table__.c, key)
+                query = query.where(column == value)
+
+        query = query.order_by(
+            getattr(self.model_class.__table__.c, self.order_by)
+        ).execution_options(stream_results=True, yield_per=self.batch_size)
+
+        # A server-side cursor reads the result in one sequential scan,
+        # unlike OFFSET/LIMIT paging where each page re-skips all prior rows.
+        result = await session.stream(query)
+
+        async for partition in result.partitions(self.batch_size):
+            yield [dict(row._mapping) for row in partition]
     
     async def stream_json(
         self,
@@ -380,31 +377,34 @@ async def stream_with_transform(
     streamer: QueryStreamer,
     session: AsyncSession,
     transform: Callable[[Dict], Dict],
-    filters: Optional[Dict[str, Any]] = None
+    filters: Optional[Dict[str, Any]] = None,
+    columns: Optional[List[str]] = None
 ) -> AsyncIterator[Dict]:
     """
     Stream records with transformation function applied.
-    
+
     Args:
         streamer: QueryStreamer instance
         session: Database session
         transform: Function to transform each record
         filters: Optional filter criteria
-    
+        columns: Optional list of column names the transform needs;
+            when given, only those columns are fetched from the database
+
     Yields:
         Transformed records
-    
+
     Example:
         ```python
         def anonymize_user(user):
             user["email"] = "***@***.com"
             return user
-        
+
         async for user in stream_with_transform(streamer, session, anonymize_user):
             print(user)
         ```
     """
-    async for record in streamer.stream_records(session, filters):
+    async for record in streamer.stream_records(session, filters, columns=columns):
         yield transform(record)
 
 
@@ -25,8 +25,9 @@ Example:
 """
 
 from contextvars import ContextVar
+from functools import lru_cache
 from typing import Optional, Any, Dict, List
-from sqlalchemy import event, Column, String
+from sqlalchemy import bindparam, event, select, text, Column, String
 from sqlalchemy.orm import DeclarativeMeta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
@@ -36,6 +37,42 @@ from .fields import StringField
 
 _current_tenant: ContextVar[Optional[str]] = ContextVar('current_tenant', default=None)
 
+# Server-side default for tenant_id on PostgreSQL: the database fills the
+# column from the app.tenant_id session variable, so bulk inserts skip the
+# per-row Python assignment entirely. Opt in on PG-only deployments with:
+#
+#     tenant_id: str = StringField(
+#         max_length=255, nullable=False, index=True,
+#         server_default=TENANT_ID_SERVER_DEFAULT,
+#     )
+#
+# and call set_tenant_session_variable(session) once per session. SQLite
+# has no session variables, so the Python-side default stays the default.
+TENANT_ID_SERVER_DEFAULT = text("current_setting('app.tenant_id', true)")
+
+
+async def set_tenant_session_variable(session: AsyncSession) -> None:
+    """
+    Push the current tenant into the PostgreSQL app.tenant_id variable.
+
+    Required when a model's tenant_id column uses
+    TENANT_ID_SERVER_DEFAULT; the setting is transaction-local
+    (set_config with is_local=true) so it cannot leak across pooled
+    connections.
+
+    Example:
+        ```python
+        async with db.session() as session:
+            await set_tenant_session_variable(session)
+            await Order.bulk_create(session, rows)  # DB assigns tenant_id
+        ```
+    """
+    tenant_id = require_tenant()
+    await session.execute(
+        text("SELECT set_config('app.tenant_id', :tenant, true)"),
+        {"tenant": tenant_id},
+    )
+
 
 def set_current_tenant(tenant_id: Optional[str]) -> None:
     """
@@ -119,6 +156,12 @@ class TenantMixin:
     def _set_tenant_on_insert(cls, mapper, connection, target):
         """Automatically set tenant_id on insert if not already set."""
         if not hasattr(target, 'tenant_id') or target.tenant_id is None:
+            column = cls.__table__.c.get('tenant_id')
+            if column is not None and column.server_default is not None:
+                # The database assigns tenant_id via its DEFAULT
+                # expression (see TENANT_ID_SERVER_DEFAULT); skip the
+                # per-row Python write
+                return
             current_tenant = get_current_tenant()
             if current_tenant is None:
                 raise ValueError(
@@ -135,11 +178,35 @@ class TenantMixin:
             return await cls.get_by(session, id=id, tenant_id=tenant_id)
         return await super().get(session, id)
     
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _tenant_filter_stmt(cls):
+        """Cached SELECT with a tenant bind param, built once per class."""
+        return select(cls).where(cls.tenant_id == bindparam("_tenant"))
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _tenant_count_stmt(cls):
+        """Cached COUNT with a tenant bind param, built once per class."""
+        from sqlalchemy import func
+        return (
+            select(func.count())
+            .select_from(cls)
+            .where(cls.tenant_id == bindparam("_tenant"))
+        )
+
     @classmethod
     async def filter_by(cls, session: AsyncSession, **filters):
         """Filter records, automatically adding tenant_id filter."""
         tenant_id = get_current_tenant()
         if tenant_id:
+            if not filters:
+                # Hot path: reuse the cached statement instead of
+                # composing the WHERE clause on every call
+                result = await session.execute(
+                    cls._tenant_filter_stmt(), {"_tenant": tenant_id}
+                )
+                return list(result.scalars().all())
             filters['tenant_id'] = tenant_id
         return await super().filter_by(session, **filters)
     
@@ -156,6 +223,11 @@ class TenantMixin:
         """Count records, filtered by current tenant."""
         tenant_id = get_current_tenant()
         if tenant_id:
+            if not filters:
+                result = await session.execute(
+                    cls._tenant_count_stmt(), {"_tenant": tenant_id}
+                )
+                return result.scalar_one()
             filters['tenant_id'] = tenant_id
         return await super().count(session, **filters)
 
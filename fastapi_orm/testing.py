@@ -1,9 +1,31 @@
+from functools import lru_cache
 from typing import Tuple, Any
 from sqlalchemy.orm import declarative_base
 from fastapi_orm.model import Model as BaseModel, ModelMeta
 import copy
 
 
+@lru_cache(maxsize=1)
+def _base_model_attrs() -> Tuple[Tuple[str, Any], ...]:
+    """
+    Introspect BaseModel's public attributes once per process.
+
+    dir() + getattr_static over the whole Model class is the expensive
+    part of create_test_model_base; the result never changes, so it is
+    memoized and replayed onto each fresh TestModel.
+    """
+    import inspect
+    attrs = []
+    for attr_name in dir(BaseModel):
+        if attr_name.startswith('_'):
+            continue
+        try:
+            attrs.append((attr_name, inspect.getattr_static(BaseModel, attr_name)))
+        except (AttributeError, TypeError):
+            pass
+    return tuple(attrs)
+
+
 def create_test_model_base() -> Tuple[Any, Any]:
     """
     Create an isolated declarative Base and Model class for testing.
@@ -51,34 +73,24 @@ def create_test_model_base() -> Tuple[Any, Any]:
         __abstract__ = True
         __allow_unmapped__ = True
     
-    # Copy methods from BaseModel, rebinding classmethods to work with TestModel hierarchy
-    import inspect
-    for attr_name in dir(BaseModel):
-        if attr_name.startswith('_'):
+    # Copy methods from BaseModel, rebinding classmethods to work with
+    # TestModel hierarchy; the attribute list itself is memoized
+    for attr_name, attr_value in _base_model_attrs():
+        # Skip if TestModel already has this attribute
+        if hasattr(TestModel, attr_name):
             continue
-        try:
-            # Get the attribute from the BaseModel class itself
-            attr_value = inspect.getattr_static(BaseModel, attr_name)
-            
-            # Skip if TestModel already has this attribute
-            if hasattr(TestModel, attr_name):
-                continue
-                
-            # Handle classmethods - need to extract and rewrap the function
-            if isinstance(attr_value, classmethod):
-                # Get the underlying function and create a new classmethod
-                func = attr_value.__func__
-                setattr(TestModel, attr_name, classmethod(func))
-            # Handle staticmethods
-            elif isinstance(attr_value, staticmethod):
-                func = attr_value.__func__
-                setattr(TestModel, attr_name, staticmethod(func))
-            # Handle regular methods and properties
-            else:
-                setattr(TestModel, attr_name, attr_value)
-        except (AttributeError, TypeError):
-            pass
-    
+
+        # Handle classmethods - need to extract and rewrap the function
+        if isinstance(attr_value, classmethod):
+            # Get the underlying function and create a new classmethod
+            setattr(TestModel, attr_name, classmethod(attr_value.__func__))
+        # Handle staticmethods
+        elif isinstance(attr_value, staticmethod):
+            setattr(TestModel, attr_name, staticmethod(attr_value.__func__))
+        # Handle regular methods and properties
+        else:
+            setattr(TestModel, attr_name, attr_value)
+
     return test_base, TestModel
 
 
@@ -192,41 +192,79 @@ class UtilsMixin:
             id_to_instance = {getattr(inst, 'id'): inst for inst in instances}
             # Return in the order of the input ids
             instances = [id_to_instance[id_] for id_ in ids if id_ in id_to_instance]
-        
+
         return instances
-    
+
+    @classmethod
+    async def get_many_fields(
+        cls: Type[T],
+        session: AsyncSession,
+        ids: List[Any],
+        fields: List[str],
+        preserve_order: bool = False
+    ) -> List[Tuple]:
+        """
+        Fetch selected columns for multiple IDs without building ORM instances.
+
+        Useful on hot read paths where only a few columns are needed:
+        rows come back as plain tuples with no identity-map insertion or
+        attribute hydration.
+
+        Args:
+            session: Database session
+            ids: List of IDs to fetch
+            fields: Column names to project
+            preserve_order: If True, returns rows in the same order as ids
+
+        Returns:
+            List of tuples, one per found row, in field order
+
+        Example:
+            names = await User.get_many_fields(session, [3, 1, 2], ["name"], preserve_order=True)
+            # Returns: [("Carol",), ("Alice",), ("Bob",)]
+        """
+        if not ids:
+            return []
+
+        columns = [cls.__table__.c[field] for field in fields]
+        query = select(cls.__table__.c.id, *columns).where(cls.id.in_(ids))
+        result = await session.execute(query)
+        rows = {row[0]: tuple(row[1:]) for row in result.all()}
+
+        if preserve_order:
+            return [rows[id_] for id_ in ids if id_ in rows]
+        return list(rows.values())
+
     @classmethod
     async def exists_many(
         cls: Type[T],
         session: AsyncSession,
         ids: List[Any]
-    ) -> Dict[Any, bool]:
+    ) -> Set[Any]:
         """
         Check existence of multiple IDs efficiently.
-        
+
         Args:
             session: Database session
             ids: List of IDs to check
-        
+
         Returns:
-            Dictionary mapping each ID to True/False for existence
-        
+            Set of the IDs that exist; absent IDs are simply not included
+
         Example:
             # Check which users exist
-            existence = await User.exists_many(session, [1, 2, 3, 999])
-            # Returns: {1: True, 2: True, 3: False, 999: False}
-            
-            if existence[1]:
+            existing = await User.exists_many(session, [1, 2, 3, 999])
+            # Returns: {1, 2}
+
+            if 1 in existing:
                 print("User 1 exists")
         """
         if not ids:
-            return {}
-        
+            return set()
+
         query = select(cls.id).where(cls.id.in_(ids))
         result = await session.execute(query)
-        existing_ids = set(result.scalars().all())
-        
-        return {id_: (id_ in existing_ids) for id_ in ids}
+        return set(result.scalars().all())
     
     async def get_changed_fields(self) -> Set[str]:
         """
@@ -283,9 +321,63 @@ class UtilsMixin:
                     "old": self_value,
                     "new": other_value
                 }
-        
+
         return diffs
-    
+
+    @classmethod
+    async def column_diff(
+        cls: Type[T],
+        session: AsyncSession,
+        id1: Any,
+        id2: Any
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Compare two rows by ID in a single self-join query.
+
+        Unlike diff(), this never materializes ORM instances: both rows'
+        columns are projected in one SELECT and only differing columns
+        appear in the result.
+
+        Args:
+            session: Database session
+            id1: ID of the "old" row
+            id2: ID of the "new" row
+
+        Returns:
+            Dictionary mapping differing field names to {'old': value, 'new': value}
+
+        Example:
+            differences = await Product.column_diff(session, 1, 2)
+            # Returns: {"name": {"old": "A", "new": "B"}}
+        """
+        a = cls.__table__.alias("a")
+        b = cls.__table__.alias("b")
+
+        columns = list(cls.__table__.columns)
+        # Explicit join keeps SQLAlchemy from flagging the two aliases as
+        # a cartesian product; the ID predicates pin one row per side
+        query = select(
+            *(a.c[col.name] for col in columns),
+            *(b.c[col.name] for col in columns),
+        ).select_from(
+            a.join(b, and_(a.c.id == id1, b.c.id == id2))
+        )
+
+        row = (await session.execute(query)).first()
+        if row is None:
+            return {}
+
+        n = len(columns)
+        diffs = {}
+        for col, old_value, new_value in zip(columns, row[:n], row[n:]):
+            if old_value != new_value:
+                diffs[col.name] = {
+                    "old": old_value,
+                    "new": new_value
+                }
+
+        return diffs
+
     @classmethod
     async def increment(
         cls: Type[T],
@@ -718,7 +810,7 @@ class OptimisticLockMixin:
         Raises:
             ConcurrentModificationError: If version mismatch (concurrent update detected)
         """
-        from fastapi_orm.exceptions import ValidationError
+        from fastapi_orm.exceptions import ConcurrentModificationError
         
         if not hasattr(self, 'version'):
             raise AttributeError(
@@ -743,7 +835,7 @@ class OptimisticLockMixin:
         
         if result.rowcount == 0:
             # Version mismatch - concurrent modification detected
-            raise ValidationError(
+            raise ConcurrentModificationError(
                 "version",
                 f"Concurrent modification detected. Please refresh and try again."
             )
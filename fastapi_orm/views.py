@@ -34,6 +34,7 @@ Example:
     ```
 """
 
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from sqlalchemy import text, DDL, event
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
@@ -63,12 +64,29 @@ class ViewManager:
     def __init__(self, engine: AsyncEngine):
         """
         Initialize view manager.
-        
+
         Args:
             engine: SQLAlchemy async engine
         """
         self.engine = engine
-    
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _create_view_stmt(name: str, select_statement: str, or_replace: bool, dialect_name: str):
+        """Build (and cache) the CREATE VIEW statement for repeat calls."""
+        if or_replace and dialect_name != "sqlite":
+            # PostgreSQL and other databases support CREATE OR REPLACE
+            return text(f"CREATE OR REPLACE VIEW {name} AS {select_statement}")
+        return text(f"CREATE VIEW {name} AS {select_statement}")
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _drop_view_stmt(name: str, if_exists: bool, cascade: bool):
+        """Build (and cache) the DROP VIEW statement for repeat calls."""
+        exists_clause = "IF EXISTS " if if_exists else ""
+        cascade_clause = " CASCADE" if cascade else ""
+        return text(f"DROP VIEW {exists_clause}{name}{cascade_clause}")
+
     async def create_view(
         self,
         name: str,
@@ -94,23 +112,18 @@ class ViewManager:
         async with self.engine.begin() as conn:
             # Check if it's SQLite
             dialect_name = conn.dialect.name
-            
-            if or_replace:
-                if dialect_name == "sqlite":
-                    # SQLite doesn't support CREATE OR REPLACE VIEW, so drop first
-                    try:
-                        await conn.execute(text(f"DROP VIEW IF EXISTS {name}"))
-                    except Exception:
-                        pass
-                    sql = f"CREATE VIEW {name} AS {select_statement}"
-                else:
-                    # PostgreSQL and other databases support CREATE OR REPLACE
-                    sql = f"CREATE OR REPLACE VIEW {name} AS {select_statement}"
-            else:
-                sql = f"CREATE VIEW {name} AS {select_statement}"
-            
-            await conn.execute(text(sql))
-        
+
+            if or_replace and dialect_name == "sqlite":
+                # SQLite doesn't support CREATE OR REPLACE VIEW, so drop first
+                try:
+                    await conn.execute(self._drop_view_stmt(name, True, False))
+                except Exception:
+                    pass
+
+            await conn.execute(
+                self._create_view_stmt(name, select_statement, or_replace, dialect_name)
+            )
+
         logger.info(f"Created view: {name}")
     
     async def drop_view(
@@ -127,13 +140,9 @@ class ViewManager:
             if_exists: Use IF EXISTS clause
             cascade: Use CASCADE option
         """
-        exists_clause = "IF EXISTS " if if_exists else ""
-        cascade_clause = " CASCADE" if cascade else ""
-        sql = f"DROP VIEW {exists_clause}{name}{cascade_clause}"
-        
         async with self.engine.begin() as conn:
-            await conn.execute(text(sql))
-        
+            await conn.execute(self._drop_view_stmt(name, if_exists, cascade))
+
         logger.info(f"Dropped view: {name}")
     
     async def create_materialized_view(
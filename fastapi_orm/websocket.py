@@ -167,6 +167,13 @@ class ConnectionManager:
         except Exception as e:
             self._logger.error(f"Error sending personal message: {e}")
     
+    async def _send(self, connection: WebSocket, message: Any) -> None:
+        """Send a message to one connection, JSON-serializing dicts/lists."""
+        if isinstance(message, (dict, list)):
+            await connection.send_json(message)
+        else:
+            await connection.send_text(str(message))
+
     async def broadcast(
         self,
         message: Any,
@@ -174,7 +181,11 @@ class ConnectionManager:
     ) -> None:
         """
         Broadcast message to all connections in a channel or all channels.
-        
+
+        Sends are fanned out concurrently with asyncio.gather instead of
+        awaiting each socket in turn, so one slow client doesn't delay
+        the rest.
+
         Args:
             message: Message to broadcast (will be JSON serialized)
             channel: Specific channel to broadcast to (None = all channels)
@@ -183,21 +194,17 @@ class ConnectionManager:
             channels = [channel] if channel in self.active_connections else []
         else:
             channels = list(self.active_connections.keys())
-        
+
         for ch in channels:
-            disconnected = []
-            for connection in self.active_connections[ch]:
-                try:
-                    if isinstance(message, (dict, list)):
-                        await connection.send_json(message)
-                    else:
-                        await connection.send_text(str(message))
-                except Exception as e:
-                    self._logger.error(f"Error broadcasting to connection: {e}")
-                    disconnected.append(connection)
-            
-            for conn in disconnected:
-                self.disconnect(conn, ch)
+            connections = list(self.active_connections[ch])
+            results = await asyncio.gather(
+                *(self._send(conn, message) for conn in connections),
+                return_exceptions=True,
+            )
+            for conn, result in zip(connections, results):
+                if isinstance(result, Exception):
+                    self._logger.error(f"Error broadcasting to connection: {result}")
+                    await self.disconnect(conn, ch)
     
     async def broadcast_to_multiple(
         self,
@@ -497,6 +504,9 @@ class WebSocketSubscriptionManager(ConnectionManager):
         super().__init__(*args, **kwargs)
         self._subscriptions: Dict[WebSocket, Dict[str, Any]] = {}
         self._user_subscriptions: Dict[str, Dict[str, Any]] = {}
+        # Reverse index user -> subscribed channel names so is_subscribed
+        # is a set lookup instead of scanning subscription records
+        self._user_channels: Dict[str, Set[str]] = {}
     
     async def subscribe(
         self,
@@ -534,6 +544,7 @@ class WebSocketSubscriptionManager(ConnectionManager):
                 "channel": channel,
                 "filters": filters
             }
+            self._user_channels.setdefault(user_id, set()).add(channel)
         else:
             # Original signature: subscribe(websocket, channel, filters)
             websocket = user_id_or_ws
@@ -577,6 +588,7 @@ class WebSocketSubscriptionManager(ConnectionManager):
                 if websocket and websocket in self._subscriptions:
                     del self._subscriptions[websocket]
                 del self._user_subscriptions[user_id]
+            self._user_channels.pop(user_id, None)
         else:
             # Original signature: unsubscribe(websocket)
             websocket = user_id_or_ws
@@ -594,6 +606,10 @@ class WebSocketSubscriptionManager(ConnectionManager):
         Returns:
             True if subscribed, False otherwise
         """
+        # Fast path: the reverse index answers with one set lookup
+        if channel in self._user_channels.get(user_id, ()):
+            return True
+
         if user_id in self._user_subscriptions:
             subscriptions = self._user_subscriptions[user_id]
             # Check if channel exists in user's subscriptions
@@ -602,7 +618,7 @@ class WebSocketSubscriptionManager(ConnectionManager):
             # Old format compatibility
             if not isinstance(subscriptions, dict):
                 return subscriptions.get("channel") == channel
-        
+
         websocket = self.get_connection(user_id)
         if not websocket or websocket not in self._subscriptions:
             return False
@@ -617,17 +633,17 @@ class WebSocketSubscriptionManager(ConnectionManager):
             channel: Channel name
             message: Message to broadcast
         """
-        # For subscription manager, send to all subscribed websockets in the channel
-        # Not filtered by subscription criteria for this direct channel broadcast
+        # For subscription manager, send to all subscribed websockets in the
+        # channel concurrently; not filtered by subscription criteria for
+        # this direct channel broadcast
         if channel in self.active_connections:
-            for websocket in self.active_connections[channel]:
-                try:
-                    if isinstance(message, (dict, list)):
-                        await websocket.send_json(message)
-                    else:
-                        await websocket.send_text(str(message))
-                except Exception as e:
-                    self._logger.error(f"Error broadcasting to channel {channel}: {e}")
+            results = await asyncio.gather(
+                *(self._send(ws, message) for ws in list(self.active_connections[channel])),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    self._logger.error(f"Error broadcasting to channel {channel}: {result}")
     
     async def broadcast(
         self,
@@ -648,12 +664,18 @@ class WebSocketSubscriptionManager(ConnectionManager):
             channels = list(self.active_connections.keys())
         
         for ch in channels:
-            for connection in self.active_connections.get(ch, set()):
-                if self._should_send_to_client(connection, message):
-                    try:
-                        await connection.send_json(message)
-                    except Exception as e:
-                        self._logger.error(f"Error sending to client: {e}")
+            recipients = [
+                connection
+                for connection in self.active_connections.get(ch, set())
+                if self._should_send_to_client(connection, message)
+            ]
+            results = await asyncio.gather(
+                *(connection.send_json(message) for connection in recipients),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    self._logger.error(f"Error sending to client: {result}")
     
     def _should_send_to_client(
         self,
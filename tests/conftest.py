@@ -1,9 +1,83 @@
+import os
+from functools import lru_cache
+from typing import Any, Optional
+
 import pytest
 import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
 from fastapi_orm import Database
 from fastapi_orm.testing import create_test_model_base
 
 
+@event.listens_for(Engine, "connect")
+def _fast_sqlite_pragmas(dbapi_conn, _connection_record):
+    """
+    Relax SQLite durability for every test engine.
+
+    Tests only ever use throwaway in-memory databases, so skipping fsync
+    and keeping the journal and temp store in memory is safe and avoids
+    per-statement syscall overhead. Registered on the Engine class so it
+    applies to every engine any fixture creates, with a driver check so
+    a non-SQLite engine (e.g. a PostgreSQL-backed test) never receives
+    the PRAGMAs. locking_mode=EXCLUSIVE is deliberately not set: the
+    shared-cache databases from shared_memory_url() can be attached by
+    more than one engine.
+    """
+    if "sqlite" not in type(dbapi_conn).__module__:
+        return
+    cursor = dbapi_conn.cursor()
+    for pragma in (
+        "PRAGMA synchronous=OFF",
+        "PRAGMA journal_mode=MEMORY",
+        "PRAGMA temp_store=MEMORY",
+    ):
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def shared_memory_url() -> str:
+    """
+    Named shared-cache in-memory SQLite URL, unique per xdist worker.
+
+    Under pytest-xdist each worker gets its own database (keyed on
+    PYTEST_XDIST_WORKER) so parallel workers never share state; without
+    xdist the name is constant and behaves like a plain :memory: DB.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return f"sqlite+aiosqlite:///file:fastapiorm_{worker_id}?mode=memory&cache=shared&uri=true"
+
+
+@lru_cache(maxsize=None)
+def make_database(url: str, base: Optional[Any] = None) -> Database:
+    """
+    Cache Database construction per (url, base).
+
+    Engine creation and mapper compilation only happen once per distinct
+    configuration for the whole test session; callers are responsible for
+    running create_tables() and must share an event loop with other users
+    of the same cached instance.
+    """
+    return Database(url, echo=False, base=base, poolclass=StaticPool)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_db():
+    """
+    One shared in-memory database (global Base) for the whole session.
+
+    Test modules that use the global Base can build their per-test
+    cleanup fixtures on top of this instead of constructing their own
+    engine per module. Requires tests to run on the session event loop.
+    """
+    database = make_database(shared_memory_url())
+    await database.create_tables()
+    yield database
+    await database.close()
+
+
 @pytest.fixture(scope="function")
 def test_base_and_model():
     """
@@ -151,5 +151,35 @@ async def test_database_with_echo():
     await database.close()
 
 
+@pytest.mark.asyncio
+async def test_in_memory_database_shares_connection():
+    """Test in-memory SQLite keeps one hot connection across sessions"""
+    from sqlalchemy.pool import StaticPool
+
+    database = Database("sqlite+aiosqlite:///:memory:", echo=False, base=TestBase)
+    assert isinstance(database.engine.pool, StaticPool)
+    await database.close()
+
+
+@pytest.mark.asyncio
+async def test_database_custom_poolclass():
+    """Test passing a custom pool class and connect args through Database"""
+    from sqlalchemy.pool import StaticPool
+
+    database = Database(
+        "sqlite+aiosqlite:///./test_poolclass.db",
+        echo=False,
+        base=TestBase,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    assert isinstance(database.engine.pool, StaticPool)
+    await database.close()
+
+    import os
+    if os.path.exists("./test_poolclass.db"):
+        os.remove("./test_poolclass.db")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
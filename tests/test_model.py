@@ -80,5 +80,21 @@ async def test_model_to_response(db):
         assert response.name == "Test"
 
 
+@pytest.mark.asyncio
+async def test_model_pluck(db):
+    """Test plucking column values without building ORM instances"""
+    async with db.session() as session:
+        await SampleModel.create(session, name="First", is_active=True)
+        await SampleModel.create(session, name="Second", is_active=False)
+        await SampleModel.create(session, name="Third", is_active=True)
+
+        names = await SampleModel.pluck(session, "name", is_active=True)
+        assert set(names) == {"First", "Third"}
+
+        pairs = await SampleModel.pluck(session, "name", "is_active")
+        assert len(pairs) == 3
+        assert ("Second", False) in pairs
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,155 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, text
+from fastapi_orm import Database, IntegerField, StringField
+from fastapi_orm.relations import (
+    ForeignKeyField,
+    ManyToMany,
+    bulk_associate,
+    create_association_table,
+)
+from fastapi_orm.testing import create_test_model_base
+
+TestBase, TestModel = create_test_model_base()
+
+book_tags = create_association_table("book_tags", "rel_books", "rel_tags", TestBase)
+
+
+class RelAuthor(TestModel):
+    __tablename__ = "rel_authors"
+
+    id: int = IntegerField(primary_key=True)
+    name: str = StringField(max_length=100, nullable=False)
+
+
+class RelPost(TestModel):
+    __tablename__ = "rel_posts"
+
+    id: int = IntegerField(primary_key=True)
+    title: str = StringField(max_length=200, nullable=False)
+    author_id: int = ForeignKeyField("rel_authors", nullable=False, ondelete="CASCADE")
+
+
+class RelBook(TestModel):
+    __tablename__ = "rel_books"
+
+    id: int = IntegerField(primary_key=True)
+    title: str = StringField(max_length=200, nullable=False)
+
+    tags = ManyToMany("RelTag", secondary=book_tags, back_populates="books")
+
+
+class RelTag(TestModel):
+    __tablename__ = "rel_tags"
+
+    id: int = IntegerField(primary_key=True)
+    name: str = StringField(max_length=100, nullable=False)
+
+    books = ManyToMany("RelBook", secondary=book_tags, back_populates="tags")
+
+
+@pytest_asyncio.fixture
+async def db():
+    database = Database("sqlite+aiosqlite:///:memory:", echo=False, base=TestBase)
+    await database.create_tables()
+    yield database
+    await database.close()
+
+
+@pytest.mark.asyncio
+async def test_foreign_key_assignment(db):
+    """Test creating child rows that reference a parent"""
+    async with db.session() as session:
+        author = await RelAuthor.create(session, name="alice")
+        post = await RelPost.create(session, title="Post 1", author_id=author.id)
+
+        assert post.author_id == author.id
+
+
+@pytest.mark.asyncio
+async def test_cascade_delete(db):
+    """Test that deleting a parent cascades to children at the database level"""
+    async with db.session() as session:
+        # SQLite only enforces ON DELETE CASCADE with foreign keys enabled
+        await session.execute(text("PRAGMA foreign_keys=ON"))
+
+        author = await RelAuthor.create(session, name="bob")
+        for i in range(3):
+            await RelPost.create(session, title=f"Post {i}", author_id=author.id)
+
+        assert await RelPost.count(session) == 3
+
+        # A single DELETE on the parent row; the database removes the
+        # children via ON DELETE CASCADE, no ORM iteration needed.
+        await author.delete(session)
+
+        assert await RelAuthor.count(session) == 0
+        assert await RelPost.count(session) == 0
+
+
+@pytest.mark.asyncio
+async def test_many_to_many_association(db):
+    """Test linking books and tags through the association table"""
+    async with db.session() as session:
+        book = await RelBook.create(session, title="Dune")
+        sci_fi = await RelTag.create(session, name="sci-fi")
+        classic = await RelTag.create(session, name="classic")
+
+        await session.execute(book_tags.insert(), [
+            {"rel_book_id": book.id, "rel_tag_id": sci_fi.id},
+            {"rel_book_id": book.id, "rel_tag_id": classic.id},
+        ])
+        await session.commit()
+        # The session caches book.tags from creation time; expire so the
+        # query below sees the association rows inserted above
+        session.expire_all()
+
+        # unique() collapses rows duplicated by the eager-loaded join
+        books = (await session.scalars(select(RelBook))).unique().all()
+
+        assert len(books) == 1
+        assert {tag.name for tag in books[0].tags} == {"sci-fi", "classic"}
+
+
+@pytest.mark.asyncio
+async def test_many_to_many_batch_fetch(db):
+    """Test fetching tags for many books with one WHERE IN query"""
+    async with db.session() as session:
+        tag = await RelTag.create(session, name="fiction")
+        books = [await RelBook.create(session, title=f"Book {i}") for i in range(5)]
+
+        await session.execute(book_tags.insert(), [
+            {"rel_book_id": book.id, "rel_tag_id": tag.id} for book in books
+        ])
+        await session.commit()
+
+        # One round-trip for all books instead of a SELECT per book
+        result = await session.execute(
+            select(book_tags.c.rel_book_id, RelTag.__table__.c.name)
+            .join(RelTag.__table__, book_tags.c.rel_tag_id == RelTag.__table__.c.id)
+            .where(book_tags.c.rel_book_id.in_([book.id for book in books]))
+        )
+        tags_by_book = {}
+        for book_id, tag_name in result:
+            tags_by_book.setdefault(book_id, []).append(tag_name)
+
+        assert len(tags_by_book) == 5
+        assert all(names == ["fiction"] for names in tags_by_book.values())
+
+
+@pytest.mark.asyncio
+async def test_bulk_associate(db):
+    """Test associating many children with one executemany INSERT"""
+    async with db.session() as session:
+        book = await RelBook.create(session, title="Anthology")
+        tags = [await RelTag.create(session, name=f"tag{i}") for i in range(10)]
+
+        inserted = await bulk_associate(session, book, "tags", tags)
+        await session.commit()
+        session.expire_all()
+
+        assert inserted == 10
+
+        books = (await session.scalars(select(RelBook))).unique().all()
+        anthology = next(b for b in books if b.title == "Anthology")
+        assert len(anthology.tags) == 10
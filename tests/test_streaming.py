@@ -22,7 +22,9 @@ class StreamUser(TestModel):
     score: int = IntegerField(default=0)
 
 
-@pytest_asyncio.fixture
+# All tests here only read the same 50-row seed, so the engine, schema and
+# seed data are built once per module instead of once per test.
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def db():
     database = Database("sqlite+aiosqlite:///:memory:", echo=False, base=TestBase)
     await database.create_tables()
@@ -30,7 +32,7 @@ async def db():
     await database.close()
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def sample_users(db):
     async with db.session() as session:
         users = []
@@ -45,7 +47,7 @@ async def sample_users(db):
         return users
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_query_streamer_basic(db, sample_users):
     async with db.session() as session:
         streamer = QueryStreamer(StreamUser, batch_size=10)
@@ -57,7 +59,7 @@ async def test_query_streamer_basic(db, sample_users):
         assert len(collected) == 50
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_query_streamer_with_filter(db, sample_users):
     async with db.session() as session:
         streamer = QueryStreamer(
@@ -72,7 +74,7 @@ async def test_query_streamer_with_filter(db, sample_users):
         assert len(collected) <= 50
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_cursor_paginator_basic(db, sample_users):
     async with db.session() as session:
         paginator = CursorPaginator(StreamUser, page_size=10)
@@ -84,7 +86,7 @@ async def test_cursor_paginator_basic(db, sample_users):
         assert page1["next_cursor"] is not None
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_cursor_paginator_navigation(db, sample_users):
     async with db.session() as session:
         paginator = CursorPaginator(StreamUser, page_size=10)
@@ -96,7 +98,7 @@ async def test_cursor_paginator_navigation(db, sample_users):
         assert page2["data"][0]["id"] != page1["data"][0]["id"]
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_batch_processor(db, sample_users):
     async with db.session() as session:
         async def process_func(record):
@@ -109,7 +111,7 @@ async def test_batch_processor(db, sample_users):
         assert result["processed"] == 50
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_stream_with_transform(db, sample_users):
     async with db.session() as session:
         
@@ -119,7 +121,9 @@ async def test_stream_with_transform(db, sample_users):
         streamer = QueryStreamer(StreamUser, batch_size=10)
         
         collected = []
-        async for item in stream_with_transform(streamer, session, transform):
+        async for item in stream_with_transform(
+            streamer, session, transform, columns=["id", "username"]
+        ):
             collected.append(item)
         
         assert len(collected) == 50
@@ -127,7 +131,7 @@ async def test_stream_with_transform(db, sample_users):
         assert all(item["name"].isupper() for item in collected)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_stream_with_filter_function(db, sample_users):
     async with db.session() as session:
         
@@ -143,7 +147,7 @@ async def test_stream_with_filter_function(db, sample_users):
         assert all(user["score"] % 2 == 0 for user in collected)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_query_streamer_ordering(db, sample_users):
     async with db.session() as session:
         streamer = QueryStreamer(
@@ -159,7 +163,7 @@ async def test_query_streamer_ordering(db, sample_users):
         assert collected[0]["score"] <= collected[-1]["score"]
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_batch_processor_with_updates(db, sample_users):
     async with db.session() as session:
         async def process_func(record):
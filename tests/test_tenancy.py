@@ -1,6 +1,6 @@
 import pytest
 import pytest_asyncio
-from fastapi_orm import Database, Model, IntegerField, StringField
+from fastapi_orm import Model, IntegerField, StringField
 from fastapi_orm.tenancy import TenantMixin, get_current_tenant, set_current_tenant
 
 
@@ -13,15 +13,32 @@ class TenantUser(TenantMixin, Model):
     tenant_id: str = StringField(max_length=100, nullable=False, index=True)
 
 
-@pytest_asyncio.fixture
-async def db():
-    database = Database("sqlite+aiosqlite:///:memory:", echo=False)
-    await database.create_tables()
-    yield database
-    await database.close()
+# Tests share the session-scoped engine from conftest and get a clean
+# slate via DELETEs instead of rebuilding the engine and re-running DDL.
+@pytest_asyncio.fixture(loop_scope="session")
+async def db(session_db):
+    yield session_db
+    async with session_db.session() as session:
+        for table in reversed(session_db.base.metadata.sorted_tables):
+            await session.execute(table.delete())
 
 
-@pytest.mark.asyncio
+# Standard two-tenant dataset seeded in one session instead of each test
+# opening three sessions and interleaving set_current_tenant calls.
+@pytest_asyncio.fixture(loop_scope="session")
+async def seeded_tenants(db):
+    async with db.session() as session:
+        set_current_tenant("tenant1")
+        user1 = await TenantUser.create(session, username="user1", email="u1@t1.com")
+        user2 = await TenantUser.create(session, username="user2", email="u2@t1.com")
+
+        set_current_tenant("tenant2")
+        user3 = await TenantUser.create(session, username="user3", email="u3@t2.com")
+
+    return {"tenant1": [user1, user2], "tenant2": [user3]}
+
+
+@pytest.mark.asyncio(loop_scope="session")
 async def test_tenant_isolation(db):
     set_current_tenant("tenant1")
     
@@ -54,14 +71,14 @@ async def test_tenant_isolation(db):
         assert users[0].username == "user1"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_current_tenant():
     set_current_tenant("test_tenant")
     
     assert get_current_tenant() == "test_tenant"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_tenant_auto_assignment(db):
     set_current_tenant("auto_tenant")
     
@@ -75,70 +92,40 @@ async def test_tenant_auto_assignment(db):
         assert user.tenant_id == "auto_tenant"
 
 
-@pytest.mark.asyncio
-async def test_tenant_filter_by(db):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tenant_filter_by(db, seeded_tenants):
     set_current_tenant("tenant1")
-    
-    async with db.session() as session:
-        await TenantUser.create(session, username="user1", email="u1@t1.com")
-        await TenantUser.create(session, username="user2", email="u2@t1.com")
-    
-    set_current_tenant("tenant2")
-    
-    async with db.session() as session:
-        await TenantUser.create(session, username="user3", email="u3@t2.com")
-    
-    set_current_tenant("tenant1")
-    
+
     async with db.session() as session:
         users = await TenantUser.filter_by(session)
-        
+
         assert len(users) == 2
         assert all(u.tenant_id == "tenant1" for u in users)
 
 
-@pytest.mark.asyncio
-async def test_cross_tenant_query_prevention(db):
-    set_current_tenant("tenant1")
-    
-    async with db.session() as session:
-        user1 = await TenantUser.create(
-            session,
-            username="user1",
-            email="user1@t1.com"
-        )
-        user1_id = user1.id
-    
+@pytest.mark.asyncio(loop_scope="session")
+async def test_cross_tenant_query_prevention(db, seeded_tenants):
+    user1_id = seeded_tenants["tenant1"][0].id
+
     set_current_tenant("tenant2")
-    
+
     async with db.session() as session:
         user = await TenantUser.get(session, user1_id)
-        
+
         assert user is None
 
 
-@pytest.mark.asyncio
-async def test_tenant_count(db):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tenant_count(db, seeded_tenants):
     set_current_tenant("tenant1")
-    
-    async with db.session() as session:
-        await TenantUser.create(session, username="u1", email="u1@t1.com")
-        await TenantUser.create(session, username="u2", email="u2@t1.com")
-    
-    set_current_tenant("tenant2")
-    
-    async with db.session() as session:
-        await TenantUser.create(session, username="u3", email="u3@t2.com")
-    
-    set_current_tenant("tenant1")
-    
+
     async with db.session() as session:
         count = await TenantUser.count(session)
-        
+
         assert count == 2
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_tenant_bulk_operations(db):
     set_current_tenant("tenant1")
     
@@ -6,12 +6,12 @@ import pytest
 import pytest_asyncio
 from decimal import Decimal
 from fastapi_orm import (
-    Database,
     Model,
     IntegerField,
     StringField,
     FloatField,
     ValidationError,
+    ConcurrentModificationError,
 )
 from fastapi_orm.utils import UtilsMixin, OptimisticLockMixin
 
@@ -47,98 +47,95 @@ class User(UtilsMixin, Model):
     is_active: bool = IntegerField(default=True)
 
 
-@pytest_asyncio.fixture
-async def db():
-    database = Database("sqlite+aiosqlite:///:memory:", echo=False)
-    await database.create_tables()
-    yield database
-    await database.close()
+# Tests share the session-scoped engine from conftest and get a clean
+# slate via DELETEs instead of rebuilding the engine and re-running DDL.
+@pytest_asyncio.fixture(loop_scope="session")
+async def db(session_db):
+    yield session_db
+    async with session_db.session() as session:
+        for table in reversed(session_db.base.metadata.sorted_tables):
+            await session.execute(table.delete())
 
 
 # Upsert Tests
-@pytest.mark.asyncio
-async def test_upsert_insert(db):
-    """Test upsert creates new record when no conflict"""
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("mode", ["insert", "update", "partial"])
+async def test_upsert(db, mode):
+    """Test upsert insert, full-update and partial-update branches"""
     async with db.session() as session:
-        product = await Product.upsert(
-            session,
-            conflict_fields=["sku"],
-            name="Test Product",
-            sku="SKU001",
-            price=29.99,
-            stock=100
-        )
-        
-        assert product.id is not None
-        assert product.name == "Test Product"
-        assert product.sku == "SKU001"
-        assert product.price == 29.99
-        assert product.stock == 100
+        if mode == "insert":
+            # No conflict: upsert creates a new record
+            product = await Product.upsert(
+                session,
+                conflict_fields=["sku"],
+                name="Test Product",
+                sku="SKU001",
+                price=29.99,
+                stock=100
+            )
 
+            assert product.id is not None
+            assert product.name == "Test Product"
+            assert product.sku == "SKU001"
+            assert product.price == 29.99
+            assert product.stock == 100
 
-@pytest.mark.asyncio
-async def test_upsert_update(db):
-    """Test upsert updates existing record on conflict"""
-    async with db.session() as session:
-        # Create initial product
-        await Product.create(
-            session,
-            name="Original Product",
-            sku="SKU002",
-            price=19.99,
-            stock=50
-        )
-        
-        # Upsert with same SKU should update
-        product = await Product.upsert(
-            session,
-            conflict_fields=["sku"],
-            name="Updated Product",
-            sku="SKU002",
-            price=24.99,
-            stock=75
-        )
-        
-        assert product.name == "Updated Product"
-        assert product.price == 24.99
-        assert product.stock == 75
-        
-        # Verify only one record exists
-        count = await Product.count(session)
-        assert count == 1
+        elif mode == "update":
+            # Create initial product
+            await Product.create(
+                session,
+                name="Original Product",
+                sku="SKU002",
+                price=19.99,
+                stock=50
+            )
 
+            # Upsert with same SKU should update
+            product = await Product.upsert(
+                session,
+                conflict_fields=["sku"],
+                name="Updated Product",
+                sku="SKU002",
+                price=24.99,
+                stock=75
+            )
 
-@pytest.mark.asyncio
-async def test_upsert_partial_update(db):
-    """Test upsert with specific update fields"""
-    async with db.session() as session:
-        # Create initial product
-        await Product.create(
-            session,
-            name="Original",
-            sku="SKU003",
-            price=10.0,
-            stock=100
-        )
-        
-        # Upsert updating only price
-        product = await Product.upsert(
-            session,
-            conflict_fields=["sku"],
-            update_fields=["price"],
-            name="Should Not Update",
-            sku="SKU003",
-            price=15.0,
-            stock=200
-        )
-        
-        assert product.name == "Original"  # Not updated
-        assert product.price == 15.0  # Updated
-        assert product.stock == 100  # Not updated
+            assert product.name == "Updated Product"
+            assert product.price == 24.99
+            assert product.stock == 75
+
+            # Verify only one record exists
+            count = await Product.count(session)
+            assert count == 1
+
+        else:
+            # Create initial product
+            await Product.create(
+                session,
+                name="Original",
+                sku="SKU003",
+                price=10.0,
+                stock=100
+            )
+
+            # Upsert updating only price
+            product = await Product.upsert(
+                session,
+                conflict_fields=["sku"],
+                update_fields=["price"],
+                name="Should Not Update",
+                sku="SKU003",
+                price=15.0,
+                stock=200
+            )
+
+            assert product.name == "Original"  # Not updated
+            assert product.price == 15.0  # Updated
+            assert product.stock == 100  # Not updated
 
 
 # Batch Operations Tests
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_many(db):
     """Test fetching multiple records by IDs"""
     async with db.session() as session:
@@ -155,73 +152,84 @@ async def test_get_many(db):
         assert names == {"P1", "P3"}
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_many_preserve_order(db):
-    """Test get_many preserves ID order"""
+    """Test ordered multi-ID fetch via the tuple-returning Core variant"""
     async with db.session() as session:
         p1 = await Product.create(session, name="P1", sku="S1", price=10)
         p2 = await Product.create(session, name="P2", sku="S2", price=20)
         p3 = await Product.create(session, name="P3", sku="S3", price=30)
-        
-        # Request in specific order
-        products = await Product.get_many(
+
+        # Request in specific order; only name is asserted, so skip full
+        # ORM hydration and project just that column
+        names = await Product.get_many_fields(
             session,
             [p3.id, p1.id, p2.id],
+            ["name"],
             preserve_order=True
         )
-        
-        assert len(products) == 3
-        assert products[0].name == "P3"
-        assert products[1].name == "P1"
-        assert products[2].name == "P2"
+
+        assert [n for (n,) in names] == ["P3", "P1", "P2"]
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_exists_many(db):
     """Test checking existence of multiple IDs"""
     async with db.session() as session:
         p1 = await Product.create(session, name="P1", sku="S1", price=10)
         p2 = await Product.create(session, name="P2", sku="S2", price=20)
         
-        existence = await Product.exists_many(
+        existing = await Product.exists_many(
             session,
             [p1.id, p2.id, 999, 1000]
         )
-        
-        assert existence[p1.id] is True
-        assert existence[p2.id] is True
-        assert existence[999] is False
-        assert existence[1000] is False
+
+        assert existing == {p1.id, p2.id}
 
 
 # Model Comparison Tests
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_diff(db):
     """Test comparing two model instances"""
     async with db.session() as session:
         p1 = await Product.create(session, name="Product A", sku="SA", price=10.0, stock=100)
         p2 = await Product.create(session, name="Product B", sku="SB", price=15.0, stock=100)
-        
-        differences = await p1.diff(p2)
-        
+
+        # Single self-join SELECT instead of diffing loaded instances
+        differences = await Product.column_diff(session, p1.id, p2.id)
+
         assert "name" in differences
         assert differences["name"]["old"] == "Product A"
         assert differences["name"]["new"] == "Product B"
-        
+
         assert "sku" in differences
         assert differences["sku"]["old"] == "SA"
         assert differences["sku"]["new"] == "SB"
-        
+
         assert "price" in differences
         assert differences["price"]["old"] == 10.0
         assert differences["price"]["new"] == 15.0
-        
+
         # stock is same, should not be in differences
         assert "stock" not in differences
 
 
+@pytest.mark.asyncio(loop_scope="session")
+async def test_diff_instances():
+    """Test the in-memory instance diff without any database round-trips"""
+    p1 = Product(name="Product A", sku="SA", price=10.0, stock=100)
+    p2 = Product(name="Product B", sku="SA", price=15.0, stock=100)
+
+    differences = await p1.diff(p2)
+
+    assert differences["name"] == {"old": "Product A", "new": "Product B"}
+    assert differences["price"] == {"old": 10.0, "new": 15.0}
+    assert "sku" not in differences
+    assert "stock" not in differences
+
+
 # Atomic Operations Tests
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_increment(db):
     """Test atomic increment operation"""
     async with db.session() as session:
@@ -244,7 +252,7 @@ async def test_increment(db):
         assert updated.view_count == 6
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_decrement(db):
     """Test atomic decrement operation"""
     async with db.session() as session:
@@ -268,26 +276,25 @@ async def test_decrement(db):
 
 
 # Select for Update Tests
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_select_for_update(db):
     """Test row locking with select_for_update"""
+    # The session context manager commits on exit; no explicit commit needed
     async with db.session() as session:
         account = await Account.create(session, name="Test Account", balance=1000.0)
-        await session.commit()
-    
+
     # Use a fresh session for the lock
     async with db.session() as session:
         # Lock row
         locked_account = await Account.select_for_update(session, account.id)
-        
+
         assert locked_account is not None
         assert locked_account.balance == 1000.0
-        
-        # Modify locked row
+
+        # Modify locked row; the session context manager's commit
+        # flushes this automatically
         locked_account.balance -= 100
-        await session.flush()
-        await session.commit()
-    
+
     # Verify changes in another session
     async with db.session() as session:
         updated = await Account.get(session, account.id)
@@ -295,7 +302,7 @@ async def test_select_for_update(db):
 
 
 # Model Cloning Tests
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_clone(db):
     """Test cloning a model instance"""
     async with db.session() as session:
@@ -323,7 +330,7 @@ async def test_clone(db):
         assert clone.view_count == 0  # Excluded, so default value
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_clone_with_overrides(db):
     """Test cloning with field overrides"""
     async with db.session() as session:
@@ -350,48 +357,44 @@ async def test_clone_with_overrides(db):
 
 
 # Random Selection Tests
-@pytest.mark.asyncio
-async def test_random(db):
+# Seed the random/sample dataset once per module; the tests only read
+# from it, so no per-test reseeding or SAVEPOINT juggling is needed.
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def seeded_products(session_db):
+    async with session_db.session() as session:
+        products = await Product.bulk_create(session, [
+            {"name": f"Product {i}", "sku": f"SKU-{i}", "price": float(i * 10)}
+            for i in range(20)
+        ])
+    yield products
+    async with session_db.session() as session:
+        await session.execute(Product.__table__.delete())
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_random(session_db, seeded_products):
     """Test getting a random record"""
-    async with db.session() as session:
-        # Create test data
-        for i in range(10):
-            await Product.create(
-                session,
-                name=f"Product {i}",
-                sku=f"SKU-{i}",
-                price=float(i * 10)
-            )
-        
+    async with session_db.session() as session:
         # Get random product
         random_product = await Product.random(session)
-        
+
         assert random_product is not None
         assert random_product.name.startswith("Product")
 
 
-@pytest.mark.asyncio
-async def test_sample(db):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_sample(session_db, seeded_products):
     """Test getting random sample"""
-    async with db.session() as session:
-        # Create test data
-        for i in range(20):
-            await Product.create(
-                session,
-                name=f"Product {i}",
-                sku=f"SKU-{i}",
-                price=float(i * 10)
-            )
-        
+    async with session_db.session() as session:
         # Get sample of 5
         sample = await Product.sample(session, 5)
-        
+
         assert len(sample) == 5
         assert len(set(p.id for p in sample)) == 5  # All different
 
 
 # Conditional Update Tests
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_update_if_success(db):
     """Test conditional update when conditions are met"""
     async with db.session() as session:
@@ -415,7 +418,7 @@ async def test_update_if_success(db):
         assert updated.price == 120.0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_update_if_failure(db):
     """Test conditional update when conditions not met"""
     async with db.session() as session:
@@ -440,7 +443,7 @@ async def test_update_if_failure(db):
 
 
 # Serialization Tests
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_to_dict_basic(db):
     """Test basic to_dict serialization"""
     async with db.session() as session:
@@ -460,7 +463,7 @@ async def test_to_dict_basic(db):
         assert data["stock"] == 100
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_to_dict_include(db):
     """Test to_dict with include filter"""
     async with db.session() as session:
@@ -480,7 +483,7 @@ async def test_to_dict_include(db):
         assert "stock" not in data
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_to_dict_exclude(db):
     """Test to_dict with exclude filter"""
     async with db.session() as session:
@@ -502,7 +505,7 @@ async def test_to_dict_exclude(db):
         assert "view_count" not in data
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_to_json(db):
     """Test JSON serialization"""
     async with db.session() as session:
@@ -522,7 +525,7 @@ async def test_to_json(db):
 
 
 # Optimistic Locking Tests
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_optimistic_locking_success(db):
     """Test successful update with optimistic locking"""
     async with db.session() as session:
@@ -537,41 +540,35 @@ async def test_optimistic_locking_success(db):
         assert account.version == 1
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_optimistic_locking_concurrent_conflict(db):
     """Test optimistic locking detects concurrent modifications"""
     async with db.session() as session:
-        # Create account
+        # Create account and remember the version a concurrent reader
+        # would have seen before our update
         account = await Account.create(session, name="Account", balance=1000.0)
-        account_id = account.id
-        
-        # Get account
-        account1 = await Account.get(session, account_id)
-        # Simulate getting the same account in a "different session" by expunging
-        session.expunge(account1)
-        
-        # Get it again (fresh instance)
-        account1 = await Account.get(session, account_id)
-        account2 = await Account.get(session, account_id)
-        
-        # Make account2's version stale (simulate concurrent read before update)
-        account2_version = account2.version
-        
+        stale_version = account.version
+
         # First update succeeds
-        await account1.update_with_lock(session, balance=900.0)
-        assert account1.version == 1
-        
-        # Restore account2's stale version to simulate it was read before account1's update
-        account2.version = account2_version
-        
-        # Second update should fail (version mismatch)
-        with pytest.raises(ValidationError) as exc_info:
-            await account2.update_with_lock(session, balance=800.0)
-        
-        assert "Concurrent modification" in str(exc_info.value)
+        await account.update_with_lock(session, balance=900.0)
+        assert account.version == 1
+
+        # Build the concurrent reader's stale copy in memory instead of
+        # issuing extra SELECT/expunge round-trips
+        stale_copy = Account(
+            id=account.id,
+            name=account.name,
+            balance=account.balance,
+            version=stale_version,
+        )
+
+        # Second update should fail (version mismatch); the dedicated
+        # subclass makes the check semantic instead of string matching
+        with pytest.raises(ConcurrentModificationError):
+            await stale_copy.update_with_lock(session, balance=800.0)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_optimistic_locking_multiple_updates(db):
     """Test multiple sequential updates with optimistic locking"""
     async with db.session() as session:
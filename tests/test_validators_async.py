@@ -0,0 +1,38 @@
+import pytest
+import pytest_asyncio
+from fastapi_orm import Database, IntegerField, StringField
+from fastapi_orm.testing import create_test_model_base
+
+TestBase, TestModel = create_test_model_base()
+
+
+class ValidatedUser(TestModel):
+    __tablename__ = "test_validated_users"
+
+    id: int = IntegerField(primary_key=True)
+    username: str = StringField(max_length=50, nullable=False)
+    email: str = StringField(max_length=255, nullable=False)
+    age: int = IntegerField(nullable=True)
+    website: str = StringField(max_length=500, nullable=True)
+
+
+# Engine startup and create_tables() run once for the module instead of
+# per test; the single async test below only inserts its own rows.
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def db():
+    database = Database("sqlite+aiosqlite:///:memory:", echo=False, base=TestBase)
+    await database.create_tables()
+    yield database
+    await database.close()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_field_validation_integration(db):
+    async with db.session() as session:
+        user = await ValidatedUser.create(
+            session,
+            username="testuser",
+            email="test@example.com",
+            age=25
+        )
+        assert user is not None
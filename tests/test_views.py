@@ -1,5 +1,6 @@
 import pytest
 import pytest_asyncio
+from sqlalchemy import text
 from fastapi_orm import Database, IntegerField, StringField, BooleanField
 from fastapi_orm.testing import create_test_model_base
 
@@ -17,24 +18,30 @@ class User(TestModel):
     department: str = StringField(max_length=100, nullable=True)
 
 
-@pytest_asyncio.fixture
+# Engine startup, create_tables() and the seed rows are shared across
+# the module: the seed data is read-only and every test creates views
+# under its own name, so per-test isolation work is unnecessary.
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def db():
     database = Database("sqlite+aiosqlite:///:memory:", echo=False, base=TestBase)
     await database.create_tables()
-    
+
+    # One executemany + one commit instead of three create/flush cycles
+    # through the aiosqlite worker thread
     async with database.session() as session:
-        await User.create(session, username="john", email="john@test.com", is_active=True, department="Engineering")
-        await User.create(session, username="jane", email="jane@test.com", is_active=True, department="Sales")
-        await User.create(session, username="bob", email="bob@test.com", is_active=False, department="Engineering")
-    
+        await User.bulk_create(session, [
+            {"username": "john", "email": "john@test.com", "is_active": True, "department": "Engineering"},
+            {"username": "jane", "email": "jane@test.com", "is_active": True, "department": "Sales"},
+            {"username": "bob", "email": "bob@test.com", "is_active": False, "department": "Engineering"},
+        ])
+
     yield database
     await database.close()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_create_view(db):
     """Test creating a database view"""
-    from sqlalchemy import text
     view_mgr = ViewManager(db.engine)
     
     await view_mgr.create_view(
@@ -50,7 +57,7 @@ async def test_create_view(db):
         assert len(rows) == 2
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_create_or_replace_view(db):
     """Test creating or replacing a view"""
     view_mgr = ViewManager(db.engine)
@@ -70,7 +77,7 @@ async def test_create_or_replace_view(db):
     assert True
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_drop_view(db):
     """Test dropping a view"""
     view_mgr = ViewManager(db.engine)
@@ -85,7 +92,7 @@ async def test_drop_view(db):
     assert True
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_drop_nonexistent_view_with_if_exists(db):
     """Test dropping non-existent view with IF EXISTS"""
     view_mgr = ViewManager(db.engine)
@@ -95,7 +102,7 @@ async def test_drop_nonexistent_view_with_if_exists(db):
     assert True
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_view_manager_initialization():
     """Test ViewManager initialization"""
     database = Database("sqlite+aiosqlite:///:memory:", echo=False, base=TestBase)
@@ -1,15 +1,23 @@
+from collections import deque
+
 import pytest
-import pytest_asyncio
 from fastapi_orm.websocket import (
     ConnectionManager,
     WebSocketEventFilter,
     WebSocketSubscriptionManager
 )
 
+# All tests share one module-scoped event loop; per-test loop creation
+# dominates these tiny cases otherwise.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 class MockWebSocket:
     def __init__(self):
-        self.messages = []
+        # deque appends stay O(1) with no list resizing if broadcast
+        # tests are ever parametrized up to thousands of sockets; the
+        # "in ws.messages" assertions work unchanged
+        self.messages = deque()
         self.closed = False
         self.accepted = False
     
@@ -28,9 +36,37 @@ class MockWebSocket:
         self.closed = True
 
 
-@pytest.mark.asyncio
-async def test_connection_manager_connect():
-    manager = ConnectionManager()
+# Managers are built once per module (heartbeat off so no background
+# task outlives a test) and their connection state is wiped between
+# tests instead of reconstructing them each time.
+@pytest.fixture(scope="module")
+def _shared_manager():
+    return ConnectionManager(enable_heartbeat=False)
+
+
+@pytest.fixture
+def manager(_shared_manager):
+    yield _shared_manager
+    _shared_manager.active_connections.clear()
+    _shared_manager._user_connections.clear()
+
+
+@pytest.fixture(scope="module")
+def _shared_sub_manager():
+    return WebSocketSubscriptionManager(enable_heartbeat=False)
+
+
+@pytest.fixture
+def sub_manager(_shared_sub_manager):
+    yield _shared_sub_manager
+    _shared_sub_manager.active_connections.clear()
+    _shared_sub_manager._user_connections.clear()
+    _shared_sub_manager._subscriptions.clear()
+    _shared_sub_manager._user_subscriptions.clear()
+    _shared_sub_manager._user_channels.clear()
+
+
+async def test_connection_manager_connect(manager):
     ws = MockWebSocket()
     
     await manager.connect(ws, "user1")
@@ -38,9 +74,7 @@ async def test_connection_manager_connect():
     assert len(manager.get_active_connections()) == 1
 
 
-@pytest.mark.asyncio
-async def test_connection_manager_disconnect():
-    manager = ConnectionManager()
+async def test_connection_manager_disconnect(manager):
     ws = MockWebSocket()
     
     await manager.connect(ws, "user1")
@@ -49,9 +83,7 @@ async def test_connection_manager_disconnect():
     assert len(manager.get_active_connections()) == 0
 
 
-@pytest.mark.asyncio
-async def test_connection_manager_send_personal_message():
-    manager = ConnectionManager()
+async def test_connection_manager_send_personal_message(manager):
     ws = MockWebSocket()
     
     await manager.connect(ws, "user1")
@@ -60,9 +92,7 @@ async def test_connection_manager_send_personal_message():
     assert "Hello User1" in ws.messages
 
 
-@pytest.mark.asyncio
-async def test_connection_manager_broadcast():
-    manager = ConnectionManager()
+async def test_connection_manager_broadcast(manager):
     ws1 = MockWebSocket()
     ws2 = MockWebSocket()
     
@@ -75,9 +105,7 @@ async def test_connection_manager_broadcast():
     assert "Broadcast Message" in ws2.messages
 
 
-@pytest.mark.asyncio
-async def test_connection_manager_broadcast_json():
-    manager = ConnectionManager()
+async def test_connection_manager_broadcast_json(manager):
     ws1 = MockWebSocket()
     ws2 = MockWebSocket()
     
@@ -91,7 +119,6 @@ async def test_connection_manager_broadcast_json():
     assert data in ws2.messages
 
 
-@pytest.mark.asyncio
 async def test_websocket_event_filter():
     filter_func = WebSocketEventFilter.create_filter(
         event_types=["user_update", "notification"]
@@ -104,9 +131,8 @@ async def test_websocket_event_filter():
     assert filter_func.should_send(event2) is False
 
 
-@pytest.mark.asyncio
-async def test_websocket_subscription_manager():
-    manager = WebSocketSubscriptionManager()
+async def test_websocket_subscription_manager(sub_manager):
+    manager = sub_manager
     ws = MockWebSocket()
     
     await manager.subscribe("user1", ws, "channel1")
@@ -114,9 +140,8 @@ async def test_websocket_subscription_manager():
     assert manager.is_subscribed("user1", "channel1")
 
 
-@pytest.mark.asyncio
-async def test_websocket_subscription_unsubscribe():
-    manager = WebSocketSubscriptionManager()
+async def test_websocket_subscription_unsubscribe(sub_manager):
+    manager = sub_manager
     ws = MockWebSocket()
     
     await manager.subscribe("user1", ws, "channel1")
@@ -125,9 +150,8 @@ async def test_websocket_subscription_unsubscribe():
     assert not manager.is_subscribed("user1", "channel1")
 
 
-@pytest.mark.asyncio
-async def test_websocket_subscription_broadcast_to_channel():
-    manager = WebSocketSubscriptionManager()
+async def test_websocket_subscription_broadcast_to_channel(sub_manager):
+    manager = sub_manager
     ws1 = MockWebSocket()
     ws2 = MockWebSocket()
     ws3 = MockWebSocket()
@@ -143,9 +167,7 @@ async def test_websocket_subscription_broadcast_to_channel():
     assert "Message for channel1" not in ws3.messages
 
 
-@pytest.mark.asyncio
-async def test_connection_manager_get_connection():
-    manager = ConnectionManager()
+async def test_connection_manager_get_connection(manager):
     ws = MockWebSocket()
     
     await manager.connect(ws, "user1")
@@ -154,9 +176,7 @@ async def test_connection_manager_get_connection():
     assert retrieved == ws
 
 
-@pytest.mark.asyncio
-async def test_connection_manager_multiple_connections():
-    manager = ConnectionManager()
+async def test_connection_manager_multiple_connections(manager):
     ws1 = MockWebSocket()
     ws2 = MockWebSocket()
     ws3 = MockWebSocket()
@@ -168,9 +188,8 @@ async def test_connection_manager_multiple_connections():
     assert len(manager.get_active_connections()) == 3
 
 
-@pytest.mark.asyncio
-async def test_websocket_subscription_multiple_channels():
-    manager = WebSocketSubscriptionManager()
+async def test_websocket_subscription_multiple_channels(sub_manager):
+    manager = sub_manager
     ws = MockWebSocket()
     
     await manager.subscribe("user1", ws, "channel1")